@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from habits_gui import HabitTable, HabitInstanceTable
+from habits_gui import HabitTable, HabitInstanceTable, parse_bool_column, parse_date_column
 
 # Necessary?
 def table_to_df(table):
@@ -12,25 +12,144 @@ def table_to_df(table):
 def plot_habit(df:pd.DataFrame):
     pass
 
+# Partial statistics for a sequence of habit instances in date order
+# Two partials of consecutive segments can be merged, so the statistics of a
+# whole file can be built from smaller pieces without holding it in memory
+class HabitStatsAccumulator():
+    def __init__(self, instances:int = 0, completed:int = 0, leading_streak:int = 0, trailing_streak:int = 0, longest_streak:int = 0):
+        # Counts for the segment
+        self.instances = instances
+        self.completed = completed
+        # Streak boundary state: completed run at the start and at the end of the segment
+        self.leading_streak = leading_streak
+        self.trailing_streak = trailing_streak
+        self.longest_streak = longest_streak
+
+    # String representation of the HabitStatsAccumulator class
+    def __repr__(self):
+        return f"HabitStatsAccumulator(instances={self.instances}, completed={self.completed}, longest_streak={self.longest_streak})"
+
+    # Builds the partial statistics for a segment of 'Done?' values
+    @classmethod
+    def from_checks(cls, checks):
+        checks = _as_bool_array(checks)
+        n = len(checks)
+        if n == 0:
+            return cls()
+        completed = int(checks.sum())
+        if completed == n:
+            return cls(n, n, n, n, n)
+
+        # Completed runs are found from the edges of the padded array
+        padded = np.concatenate(([0], checks.astype(np.int8), [0]))
+        edges = np.diff(padded)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        longest = int((ends - starts).max()) if len(starts) else 0
+
+        leading = int(np.argmin(checks))
+        trailing = int(np.argmin(checks[::-1]))
+        return cls(n, completed, leading, trailing, longest)
+
+    # Merges the statistics of the segment that directly follows this one
+    def merge(self, other:"HabitStatsAccumulator"):
+        if self.instances == 0:
+            return other
+        if other.instances == 0:
+            return self
+
+        self_all_done = self.completed == self.instances
+        other_all_done = other.completed == other.instances
+        return HabitStatsAccumulator(
+            instances=self.instances + other.instances,
+            completed=self.completed + other.completed,
+            leading_streak=self.leading_streak + other.leading_streak if self_all_done else self.leading_streak,
+            trailing_streak=other.trailing_streak + self.trailing_streak if other_all_done else other.trailing_streak,
+            longest_streak=max(self.longest_streak, other.longest_streak, self.trailing_streak + other.leading_streak),
+        )
+
+    # Converts the accumulated values into the dictionary used by show_habit_stats
+    def to_stats(self, habit_name:str):
+        return {
+            'habit': habit_name,
+            'instances': self.instances,
+            'completed_instances': self.completed,
+            'completion_rate': (self.completed / self.instances * 100) if self.instances else float('nan'),
+            'longest_streak': self.longest_streak,
+            'current_streak': self.trailing_streak,
+        }
+
+# Converts a 'Done?' column into a boolean numpy array
+# Values read back from a CSV file may be strings instead of booleans; missing and invalid values count as not done
+def _as_bool_array(values):
+    if isinstance(values, np.ndarray) and values.dtype == bool:
+        return values
+    return parse_bool_column(pd.Series(values)).fillna(False).to_numpy(dtype=bool)
+
+# Parses a 'Date' column, which may already hold timestamps when loaded with the schema types
+def _as_dates(column:pd.Series):
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return column
+    return parse_date_column(column)
+
 # Calculates statistics for a specific habit
-# This function assumes the DataFrame has columns 'Habit', 'Done?'
+# This function assumes the DataFrame has columns 'Habit', 'Date', 'Done?'
+# Streaks follow the date order, whatever the order of the rows
 def calculate_habit_stats(df:pd.DataFrame, habit_name:str):
     """
     Calculate statistics for a habit DataFrame.
     """
-    if habit_name not in df['habit_name'].values:
+    if habit_name not in df['Habit'].values:
         raise ValueError(f"Habit '{habit_name}' not found in DataFrame.")
     habit_df = df[df['Habit'] == habit_name]
-    stats = {
-        'habit': habit_name,
-        'instances': len(habit_df),
-        'completed_instances': habit_df['Done?'].sum(),
-        'completion_rate': habit_df['Done?'].mean() * 100,
-        #'average_duration': habit_df['duration'].mean() if 'duration' in habit_df.columns else None,
-        #'average_streak': habit_df['streak'].mean() if 'streak' in habit_df.columns else None
-    }
+    dates = _as_dates(habit_df['Date'])
+    order = np.argsort(dates.to_numpy(), kind='stable')
+    stats = HabitStatsAccumulator.from_checks(habit_df['Done?'].to_numpy()[order]).to_stats(habit_name)
+    #'average_duration': habit_df['duration'].mean() if 'duration' in habit_df.columns else None,
     return stats
 
+# Reads a habit instance CSV file in chunks
+# Only the columns needed for the statistics are loaded
+def iter_instance_chunks(filename:str, chunksize:int = 100_000, columns:list = None):
+    """
+    Yield DataFrames of at most chunksize rows from a habit instance CSV file.
+    """
+    columns = columns or ['Habit', 'Date', 'Done?']
+    dtypes = {column: str for column in ('Habit', 'Date') if column in columns}
+    for chunk in pd.read_csv(filename, usecols=columns, dtype=dtypes, chunksize=chunksize, encoding='utf-8'):
+        yield chunk
+
+# Calculates statistics for a specific habit without loading the whole file
+# The rows may be in any order: each date keeps its own partial statistics, merged in file
+# order, and the dates are folded in date order at the end, so memory is bounded by the
+# chunk size plus the number of distinct dates of the habit
+def calculate_habit_stats_streaming(filename:str, habit_name:str, chunksize:int = 100_000):
+    """
+    Calculate the same statistics as calculate_habit_stats from a CSV file read in chunks.
+    """
+    per_date = {}
+    for chunk in iter_instance_chunks(filename, chunksize):
+        habit_chunk = chunk[chunk['Habit'] == habit_name]
+        if habit_chunk.empty:
+            continue
+        # Missing dates sort last, as they do in calculate_habit_stats
+        dates = _as_dates(habit_chunk['Date']).to_numpy(dtype='datetime64[ns]')
+        keys = np.where(np.isnat(dates), np.iinfo(np.int64).max, dates.astype(np.int64))
+        # A stable sort groups the rows of each date and keeps their file order
+        order = np.argsort(keys, kind='stable')
+        keys, checks = keys[order], _as_bool_array(habit_chunk['Done?'])[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        for key, group in zip(keys[starts], np.split(checks, starts[1:])):
+            partial = HabitStatsAccumulator.from_checks(group)
+            per_date[key] = per_date[key].merge(partial) if key in per_date else partial
+
+    accumulator = HabitStatsAccumulator()
+    for key in sorted(per_date):
+        accumulator = accumulator.merge(per_date[key])
+    if accumulator.instances == 0:
+        raise ValueError(f"Habit '{habit_name}' not found in file '{filename}'.")
+    return accumulator.to_stats(habit_name)
+
 # Displays statistics for a specific habit
 # This function prints the statistics calculated by calculate_habit_stats
 def show_habit_stats(df:pd.DataFrame, habit_name:str):
@@ -43,4 +162,5 @@ def show_habit_stats(df:pd.DataFrame, habit_name:str):
     print(f"  Completed Instances: {stats['completed_instances']}")
     print(f"  Completion Rate: {stats['completion_rate']:.2f}%")
     #print(f"  Average Duration: {stats['average_duration']:.2f} minutes" if stats['average_duration'] is not None else "  Average Duration: N/A")
-    #print(f"  Average Streak: {stats['average_streak']:.2f} days" if stats['average_streak'] is not None else "  Average Streak: N/A")
\ No newline at end of file
+    print(f"  Longest Streak: {stats['longest_streak']}")
+    print(f"  Current Streak: {stats['current_streak']}")
\ No newline at end of file
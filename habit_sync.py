@@ -0,0 +1,347 @@
+import bisect
+import json
+import logging
+import os
+import uuid
+from collections import OrderedDict
+import pandas as pd
+from habits_gui import DATE_FORMAT, parse_bool, parse_date
+
+##########################################################################
+                        # SyncStore Class
+    # Change-set based store for habit instances shared between devices
+##########################################################################
+
+# Columns of the instance records and of the change log
+# Deleted records are kept as tombstones, so deletions are synced like any other change
+RECORD_COLUMNS = ['Habit', 'Date', 'Done?', 'Conditions Out of Control?']
+SYNC_COLUMNS = RECORD_COLUMNS + ['Deleted', 'Seq', 'Version', 'Device']
+
+class SyncStore():
+    """
+    Habit instance store keyed by (habit, date) with a monotonic change sequence.
+
+    Every accepted change is appended to an append-only change log, so saving
+    and exporting deltas scale with the number of changes, not the history.
+    Conflicts are resolved by keeping the record with the highest
+    (Version, Device) pair, which every device computes the same way.
+    Dates are normalized to DATE_FORMAT, so one day is always one key.
+    """
+    def __init__(self, filename:str = "habit_instances_sync.csv", device_id:str = None):
+        if not filename.endswith('.csv'):
+            raise ValueError("Filename must end with .csv")
+
+        # Storing the change log and metadata filenames
+        self._filename = filename
+        self._meta_filename = os.path.splitext(filename)[0] + ".sync.json"
+
+        # Records ordered by their local change sequence
+        self._records = OrderedDict()
+        self._seq = 0
+        self._peers = {}
+        self._device_id = device_id
+
+        self._load()
+        if self._device_id is None:
+            self._device_id = uuid.uuid4().hex
+        self._save_meta()
+
+    # String representation of the SyncStore class
+    def __repr__(self):
+        return f"Sync Store Data:\n Device: {self._device_id}\n Records: {len(self._records)}\n Sequence: {self._seq}"
+
+    # Setters and getters
+    @property
+    def device_id(self):
+        return self._device_id
+
+    @property
+    def seq(self):
+        return self._seq
+
+    @property
+    def peers(self):
+        return dict(self._peers)
+
+    # Records a local change for a habit on a date
+    def record(self, habit:str, date:str, check:bool = False, out_of_control:bool = False):
+        self.record_many([(habit, date, check, out_of_control)])
+
+    # Records the deletion of the instance of a habit on a date
+    def delete(self, habit:str, date:str):
+        self.record_many([(habit, date, False, False)], deleted=True)
+
+    # Records several local changes given as (habit, date, check, out_of_control) tuples
+    # The change log is written once for the whole batch
+    def record_many(self, records:list, deleted:bool = False):
+        rows = []
+        for habit, date, check, out_of_control in records:
+            assert habit is not None and len(habit) > 0, "Habit must not be empty."
+            self._seq += 1
+            row = {
+                'Habit': habit,
+                'Date': _normalize_date(date),
+                'Done?': bool(check),
+                'Conditions Out of Control?': bool(out_of_control),
+                'Deleted': deleted,
+                'Seq': self._seq,
+                'Version': self._seq,
+                'Device': self._device_id,
+            }
+            self._put(row)
+            rows.append(row)
+        self._append_to_log(rows)
+
+    # Records the given (habit, date, check, out_of_control) tuples that the store does not have yet
+    # Used to start tracking instances that were logged before syncing was enabled
+    def seed(self, records:list):
+        missing = [record for record in records if (record[0], _normalize_date(record[1])) not in self._records]
+        self.record_many(missing)
+        return len(missing)
+
+    # Returns the changes made after the given local sequence number
+    # Walks the records from the newest one, so the cost is proportional to the delta
+    def export_changes(self, since:int = 0, exclude_device:str = None):
+        rows = []
+        for key in reversed(self._records):
+            row = self._records[key]
+            if row['Seq'] <= since:
+                break
+            if exclude_device is not None and row['Device'] == exclude_device:
+                continue
+            rows.append(row)
+        rows.reverse()
+        return pd.DataFrame(rows, columns=SYNC_COLUMNS)
+
+    # Merges a change set received from a peer
+    # Returns the number of records that were accepted
+    def apply_changes(self, changes:pd.DataFrame, peer_id:str, peer_seq:int):
+        return len(self._merge(changes, peer_id, peer_seq))
+
+    # Exchanges deltas with a sync endpoint in both directions
+    # Records that were written by the endpoint itself are not sent back to it
+    # Returns the number of records sent and a DataFrame with the accepted records
+    def sync_with(self, endpoint):
+        outgoing = self.export_changes(endpoint.last_seen(self._device_id), exclude_device=endpoint.device_id)
+        if not outgoing.empty:
+            endpoint.push(self._device_id, self._seq, outgoing)
+
+        accepted = []
+        for peer_id, peer_seq, changes in endpoint.pull(self._device_id, self.peers):
+            accepted.extend(self._merge(changes, peer_id, peer_seq))
+        logging.info(f"Synced with {endpoint.device_id}: sent {len(outgoing)}, accepted {len(accepted)}.")
+        return len(outgoing), pd.DataFrame(accepted, columns=SYNC_COLUMNS)[RECORD_COLUMNS + ['Deleted']]
+
+    # Syncs through a shared folder, see FolderSyncEndpoint
+    def sync_with_folder(self, directory:str):
+        return self.sync_with(FolderSyncEndpoint(directory))
+
+    # Returns the current records with the same columns as the HabitInstanceTable
+    def to_dataframe(self):
+        rows = [row for row in self._records.values() if not row['Deleted']]
+        return pd.DataFrame(rows, columns=SYNC_COLUMNS)[RECORD_COLUMNS]
+
+    # Rewrites the change log keeping only the latest version of each record
+    def compact(self):
+        df = pd.DataFrame(list(self._records.values()), columns=SYNC_COLUMNS)
+        df.to_csv(self._filename, index=False, encoding='utf-8')
+
+    # Merges the records of a change set that are newer than the local ones
+    # Returns the accepted records
+    def _merge(self, changes:pd.DataFrame, peer_id:str, peer_seq:int):
+        assert peer_id != self._device_id, "Cannot apply changes from the same device."
+
+        accepted = []
+        for change in changes.to_dict('records'):
+            try:
+                incoming = _read_row(change)
+            except ValueError as e:
+                logging.warning(f"Skipped change from {peer_id}: {e}")
+                continue
+            current = self._records.get((incoming['Habit'], incoming['Date']))
+            if current is not None and (current['Version'], current['Device']) >= (incoming['Version'], incoming['Device']):
+                continue
+
+            # Lamport clock: local changes made after this one must win over it
+            self._seq = max(self._seq, incoming['Version']) + 1
+            incoming['Seq'] = self._seq
+            self._put(incoming)
+            accepted.append(incoming)
+
+        self._append_to_log(accepted)
+        self._peers[peer_id] = max(self._peers.get(peer_id, 0), int(peer_seq))
+        self._save_meta()
+        return accepted
+
+    # Stores a record and moves it to the end, keeping the sequence order
+    def _put(self, row:dict):
+        key = (row['Habit'], row['Date'])
+        self._records[key] = row
+        self._records.move_to_end(key)
+
+    # Appends the accepted records to the change log with a single write
+    def _append_to_log(self, rows:list):
+        if not rows:
+            return
+        write_header = not os.path.exists(self._filename)
+        pd.DataFrame(rows, columns=SYNC_COLUMNS).to_csv(self._filename, mode='a', header=write_header, index=False, encoding='utf-8')
+
+    # Replays the change log and reads the device metadata
+    def _load(self):
+        try:
+            with open(self._meta_filename, encoding='utf-8') as f:
+                meta = json.load(f)
+            self._device_id = self._device_id or meta.get('device_id')
+            self._peers = {peer: int(seq) for peer, seq in meta.get('peers', {}).items()}
+        except FileNotFoundError:
+            pass
+
+        try:
+            log = pd.read_csv(self._filename, encoding='utf-8', dtype={'Habit': str, 'Date': str, 'Device': str})
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logging.error(f"An error occurred while loading the file '{self._filename}': {e}")
+            return
+
+        for change in log.to_dict('records'):
+            try:
+                row = _read_row(change)
+            except ValueError as e:
+                logging.warning(f"Skipped change in '{self._filename}': {e}")
+                continue
+            self._put(row)
+            self._seq = max(self._seq, row['Seq'])
+
+    # Saves the device id and the last sequence seen from each peer
+    def _save_meta(self):
+        with open(self._meta_filename, 'w', encoding='utf-8') as f:
+            json.dump({'device_id': self._device_id, 'peers': self._peers}, f)
+
+# Normalizes a date to DATE_FORMAT, using the same rule as the habit instance table
+def _normalize_date(value):
+    if pd.isna(value):
+        raise ValueError("Date must not be empty.")
+    return parse_date(value).strftime(DATE_FORMAT)
+
+# Converts a change read from a CSV file or a peer into a record
+def _read_row(change:dict):
+    return {
+        'Habit': str(change['Habit']),
+        'Date': _normalize_date(change['Date']),
+        'Done?': parse_bool(change['Done?']),
+        'Conditions Out of Control?': parse_bool(change['Conditions Out of Control?']),
+        'Deleted': parse_bool(change.get('Deleted', False)),
+        'Seq': int(change.get('Seq', 0)),
+        'Version': int(change['Version']),
+        'Device': str(change['Device']),
+    }
+
+##########################################################################
+            # LoopbackSyncEndpoint and FolderSyncEndpoint Classes
+##########################################################################
+
+# Endpoint that syncs directly with another SyncStore in the same process
+class LoopbackSyncEndpoint():
+    def __init__(self, store:SyncStore):
+        self._store = store
+
+    @property
+    def device_id(self):
+        return self._store.device_id
+
+    # Last sequence of the given device that the remote store has merged
+    def last_seen(self, device_id:str):
+        return self._store.peers.get(device_id, 0)
+
+    # Sends a change set to the remote store
+    def push(self, device_id:str, seq:int, changes:pd.DataFrame):
+        self._store.apply_changes(changes, device_id, seq)
+
+    # Returns the remote changes the caller has not seen yet
+    # Records written by the caller itself are not sent back
+    def pull(self, device_id:str, peers:dict):
+        since = peers.get(self._store.device_id, 0)
+        changes = self._store.export_changes(since, exclude_device=device_id)
+        return [(self._store.device_id, self._store.seq, changes)]
+
+# Endpoint backed by a shared folder, where every push is written as a batch file
+# Batch files are named '<device>_<seq>.csv' and an index file in the folder keeps the
+# sorted batch sequences of each device, so syncs do not list the folder and pulls only
+# read unseen batches
+class FolderSyncEndpoint():
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, directory:str):
+        self._directory = directory
+        self._index_filename = os.path.join(directory, self.INDEX_FILENAME)
+        os.makedirs(directory, exist_ok=True)
+        self._index = self._load_index()
+
+    @property
+    def device_id(self):
+        return self._directory
+
+    # Last sequence of the given device that has been pushed to the folder
+    def last_seen(self, device_id:str):
+        seqs = self._index.get(device_id)
+        return seqs[-1] if seqs else 0
+
+    # Writes a change set as a new batch file and adds it to the index
+    # The index is read again just before it is updated, to keep batches pushed meanwhile by other devices
+    def push(self, device_id:str, seq:int, changes:pd.DataFrame):
+        changes.to_csv(self._batch_path(device_id, seq), index=False, encoding='utf-8')
+        self._index = self._load_index()
+        seqs = self._index.setdefault(device_id, [])
+        if seq not in seqs:
+            bisect.insort(seqs, seq)
+        self._save_index()
+
+    # Returns the batches of the other devices the caller has not seen yet
+    # A missing batch stops the pull of its device, so the caller does not skip over it
+    def pull(self, device_id:str, peers:dict):
+        pulled = []
+        for device, seqs in self._index.items():
+            if device == device_id:
+                continue
+            for seq in seqs[bisect.bisect_right(seqs, peers.get(device, 0)):]:
+                try:
+                    changes = pd.read_csv(self._batch_path(device, seq), encoding='utf-8', dtype={'Habit': str, 'Date': str, 'Device': str})
+                except FileNotFoundError:
+                    logging.warning(f"Batch {seq} of {device} is missing from '{self._directory}'.")
+                    break
+                pulled.append((device, seq, changes))
+        return pulled
+
+    # Path of the batch file of a device
+    def _batch_path(self, device_id:str, seq:int):
+        return os.path.join(self._directory, f"{device_id}_{seq:012d}.csv")
+
+    # Reads the index, rebuilding it from the batch files when it is missing or unreadable
+    def _load_index(self):
+        try:
+            with open(self._index_filename, encoding='utf-8') as f:
+                return {device: sorted(int(seq) for seq in seqs) for device, seqs in json.load(f).items()}
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError, AttributeError) as e:
+            logging.warning(f"Rebuilding the sync index of '{self._directory}': {e}")
+
+        index = {}
+        for entry in os.listdir(self._directory):
+            if not entry.endswith('.csv') or '_' not in entry:
+                continue
+            device, seq = entry[:-len('.csv')].rsplit('_', 1)
+            if seq.isdigit():
+                index.setdefault(device, []).append(int(seq))
+        self._index = {device: sorted(seqs) for device, seqs in index.items()}
+        if self._index:
+            self._save_index()
+        return self._index
+
+    # Writes the index to a temporary file first, so readers never see a partial index
+    def _save_index(self):
+        temporary = self._index_filename + ".tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(temporary, self._index_filename)
@@ -1,21 +1,129 @@
-from PySide6.QtCore import QAbstractTableModel, Qt
+from PySide6.QtCore import QAbstractTableModel, QDate, QModelIndex, QObject, QTimer, Qt, Signal
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QMainWindow, QTableView, QHeaderView, QLineEdit
-from PySide6.QtWidgets import QFormLayout, QLabel, QComboBox, QSpinBox, QMessageBox
+from PySide6.QtWidgets import QFormLayout, QLabel, QComboBox, QSpinBox, QMessageBox, QDateEdit, QListWidget, QListWidgetItem, QFileDialog
 import pandas as pd
 import numpy as np
+import heapq
+import itertools
 import logging
+import os
+
+# The pyarrow CSV engine is used when it is installed, since it parses in parallel
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
 
 logging.basicConfig(level=logging.INFO)
 
+# Date format used for habit instances in the tables and CSV files
+# Dates are also accepted in ISO 8601, both when loading files and when typed in the UI
+DATE_FORMAT = "%d/%m/%Y"
+ACCEPTED_DATE_FORMATS = (DATE_FORMAT, 'ISO8601')
+
+# Column types used when loading the CSV files
+# 'date' columns are parsed with DATE_FORMAT
+HABIT_SCHEMA = {'Name': 'category', 'Type': 'category', 'Weekly Frequency': 'Int64', 'Instances': 'Int64'}
+HABIT_INSTANCE_SCHEMA = {'Habit': 'category', 'Date': 'date', 'Done?': 'boolean', 'Conditions Out of Control?': 'boolean'}
+
+# Types used by the C engine to read the nullable schema types, which it parses faster
+# The C engine raises on missing values with these types, while pyarrow would read them as
+# False or fail differently, so pyarrow reads the nullable types directly
+FAST_READ_DTYPES = {'Int64': 'int64', 'boolean': 'bool'} if CSV_ENGINE == 'c' else {}
+
+# Strings accepted for boolean values, both in CSV files and when typed in the UI
+BOOL_VALUES = {'yes': True, 'true': True, '1': True, 'no': False, 'false': False, '0': False}
+
+# Parses a boolean value, such as an edited cell or a value read back from a CSV file
+# Raises a ValueError for values that are not in BOOL_VALUES, including missing values
+def parse_bool(value):
+    key = str(value).strip().lower()
+    if key not in BOOL_VALUES:
+        raise ValueError(f"Invalid value '{value}', expected Yes or No.")
+    return BOOL_VALUES[key]
+
+# Parses a column of booleans with the same rule as parse_bool
+# Missing values and values that are not in BOOL_VALUES become <NA>
+def parse_bool_column(column:pd.Series):
+    if pd.api.types.is_bool_dtype(column):
+        return column.astype('boolean')
+    return column.astype('string').str.strip().str.lower().map(BOOL_VALUES).astype('boolean')
+
+# Parses a date entered as a string in one of the ACCEPTED_DATE_FORMATS
+def parse_date(value):
+    if isinstance(value, str):
+        for date_format in ACCEPTED_DATE_FORMATS:
+            try:
+                return pd.to_datetime(value.strip(), format=date_format)
+            except ValueError:
+                pass
+        raise ValueError(f"Invalid date '{value}', expected DD/MM/YYYY or YYYY-MM-DD.")
+    return pd.Timestamp(value)
+
+# Parses a column of dates with the same rule as parse_date
+# Values that match none of the ACCEPTED_DATE_FORMATS become NaT
+def parse_date_column(column:pd.Series):
+    column = column.astype('string').str.strip()
+    converted = pd.to_datetime(column, format=DATE_FORMAT, errors='coerce')
+    for date_format in ACCEPTED_DATE_FORMATS[1:]:
+        missing = converted.isna() & column.notna()
+        if not missing.any():
+            break
+        converted[missing] = pd.to_datetime(column[missing], format=date_format, errors='coerce')
+    return converted
+
+# Formats a DataFrame value for the table views
+def _format_value(value):
+    if isinstance(value, pd.Timestamp):
+        return value.strftime(DATE_FORMAT)
+    return str(value)
+
+# Parses a column of date strings, parsing each distinct value only once
+# Returns the parsed column and the number of values that could not be parsed
+def _parse_unique_dates(column:pd.Series):
+    codes, uniques = pd.factorize(column)
+    parsed = parse_date_column(pd.Series(uniques)).to_numpy()
+    values = np.where(codes >= 0, parsed[codes], np.datetime64('NaT'))
+    converted = pd.Series(values, index=column.index, name=column.name)
+    invalid = int((codes >= 0).sum() - converted.notna().sum())
+    return converted, invalid
+
+# Converts a column read as strings into the type declared in a schema
+# Returns the converted column and the number of values that could not be converted
+def _coerce_column(column:pd.Series, dtype:str):
+    if dtype == 'date':
+        converted = parse_date_column(column)
+    elif dtype == 'Int64':
+        numbers = pd.to_numeric(column, errors='coerce')
+        converted = numbers.where(numbers % 1 == 0).astype('Int64')
+    elif dtype == 'boolean':
+        converted = parse_bool_column(column)
+    else:
+        converted = column.astype(dtype)
+    invalid = int((column.notna() & converted.isna()).sum())
+    return converted, invalid
+
 ##########################################################################
                         # CSVHandler Class
         # Separate class for handling CSV operations
 ##########################################################################
 class CSVHandler:
-    def __init__(self, filename:str = "habits.csv", df:pd.DataFrame = None, columns:list = None):
+    def __init__(self, filename:str = "habits.csv", df:pd.DataFrame = None, columns:list = None, schema:dict = None):
         # Storing the filename and DataFrame
         self._filename = filename
         self._columns = columns or ['Name', 'Type', 'Weekly Frequency', 'Instances']
+        # Column types used by load_from_csv, defaulting to the habit columns' types
+        if schema is not None:
+            self._schema = schema
+        else:
+            self._schema = {column: dtype for column, dtype in HABIT_SCHEMA.items() if column in self._columns}
+        self._validation_report = None
+        # Number of DataFrame rows known to be stored in the file, in the same order, and the
+        # file size, modification time and columns recorded at that point to detect outside changes
+        # None when the DataFrame was not loaded from or saved to the current file
+        self._saved_rows = None
+        self._saved_state = None
         if df is not None:
             self._dataframe = df
         else:
@@ -29,6 +137,8 @@ class CSVHandler:
     @filename.setter
     def filename(self, filename:str):
         assert filename.endswith('.csv'), "Filename must end with .csv"   
+        if filename != self._filename:
+            self.mark_unsaved()
         self._filename = filename
     
     @property
@@ -39,6 +149,15 @@ class CSVHandler:
     def dataframe(self, df:pd.DataFrame):
         assert isinstance(df, pd.DataFrame), "Data must be a pandas DataFrame."
         self._dataframe = df
+
+    @property
+    def schema(self):
+        return self._schema
+
+    # Report of the last load: row count, engine, missing/unexpected columns and missing/invalid values per column
+    @property
+    def validation_report(self):
+        return self._validation_report
     
     # Method for saving the DataFrame to a CSV file
     def save_to_csv(self):
@@ -46,19 +165,122 @@ class CSVHandler:
             raise ValueError("Filename must end with .csv")
         if self._dataframe.empty:
             print("DataFrame is empty. Nothing to save.")
+            self.mark_unsaved()
+            return
+        self._dataframe.to_csv(self._filename, index=False, encoding='utf-8', date_format=DATE_FORMAT)
+        self._mark_saved()
+
+    # Method for saving only the given rows of the DataFrame to the CSV file
+    # Rows added after the last save are appended and, when rows were modified, their lines are
+    # replaced, so the rest of the DataFrame does not need to be serialized again
+    # Patching is only done when the file is unchanged since the last save, otherwise it is rewritten
+    def save_rows(self, rows):
+        if not self._filename.endswith('.csv'):
+            raise ValueError("Filename must end with .csv")
+        saved_rows = self._saved_rows
+        if saved_rows is None or saved_rows > len(self._dataframe) or self._file_state() != self._saved_state:
+            self.save_to_csv()
             return
-        self._dataframe.to_csv(self._filename, index=False, encoding='utf-8')
+
+        changed_rows = sorted(row for row in set(rows) if row < saved_rows)
+        new_rows = list(range(saved_rows, len(self._dataframe)))
+        if not changed_rows and not new_rows:
+            return
+        serialized = self._dataframe.iloc[changed_rows + new_rows].to_csv(index=False, header=False, date_format=DATE_FORMAT)
+        lines = serialized.splitlines(keepends=True)
+        if len(lines) != len(changed_rows) + len(new_rows):
+            # Values spanning several lines cannot be patched in place
+            self.save_to_csv()
+            return
+
+        if not changed_rows:
+            with open(self._filename, 'a', encoding='utf-8', newline='') as file:
+                file.write(serialized)
+            self._mark_saved()
+            return
+
+        with open(self._filename, encoding='utf-8', newline='') as file:
+            file_lines = file.readlines()
+        if len(file_lines) != saved_rows + 1:
+            self.save_to_csv()
+            return
+        for row, line in zip(changed_rows, lines):
+            file_lines[row + 1] = line
+        file_lines.extend(lines[len(changed_rows):])
+        with open(self._filename, 'w', encoding='utf-8', newline='') as file:
+            file.writelines(file_lines)
+        self._mark_saved()
+
+    # Method to mark the file as out of sync with the DataFrame
+    # The next save_rows call will rewrite the whole file
+    def mark_unsaved(self):
+        self._saved_rows = None
+        self._saved_state = None
+
+    # Records that the file holds the current DataFrame rows
+    def _mark_saved(self):
+        self._saved_rows = len(self._dataframe)
+        self._saved_state = self._file_state()
+
+    # Returns the file size, modification time and the DataFrame columns, or None when the file is missing
+    def _file_state(self):
+        try:
+            stat = os.stat(self._filename)
+        except FileNotFoundError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns, tuple(self._dataframe.columns))
 
     # Method for loading the DataFrame from a CSV file
+    # Columns are read with the types declared in the schema, so pandas skips type inference
     def load_from_csv(self):
         try:
-            self._dataframe = pd.read_csv(self._filename, encoding='utf-8')
+            self._dataframe = self._read_typed_csv()
+            self._mark_saved()
         except FileNotFoundError:
             print(f"File {self._filename} not found. Creating a new one.")
-            self._dataframe = pd.DataFrame(columns=['Name', 'Type', 'Weekly Frequency', 'Instances'])
+            self._dataframe = pd.DataFrame(columns=self._columns)
+            self._validation_report = None
+            self.mark_unsaved()
         except Exception as e:
             logging.error(f"An error occurred while loading the file '{self._filename}': {e}")
-        
+
+    # Reads the CSV file with the schema types and builds the validation report
+    def _read_typed_csv(self):
+        header = pd.read_csv(self._filename, encoding='utf-8', nrows=0).columns.tolist()
+        schema = {column: dtype for column, dtype in self._schema.items() if column in header}
+        invalid = {}
+
+        # Fast path: every value matches its declared type
+        # Missing values stay missing with both engines; dates are parsed once per distinct string
+        dtypes = {column: FAST_READ_DTYPES.get(dtype, dtype) for column, dtype in schema.items() if dtype != 'date'}
+        try:
+            df = pd.read_csv(self._filename, encoding='utf-8', engine=CSV_ENGINE, dtype=dtypes)
+            missing = {column: int(df[column].isna().sum()) for column in schema}
+            for column, dtype in schema.items():
+                if dtype == 'date':
+                    df[column], invalid[column] = _parse_unique_dates(df[column])
+                elif dtype in FAST_READ_DTYPES:
+                    df[column] = df[column].astype(dtype)
+        except (ValueError, TypeError):
+            # Slow path: some values do not match, so columns are converted one by one
+            # and the values that could not be converted are counted
+            df = pd.read_csv(self._filename, encoding='utf-8', engine=CSV_ENGINE, dtype=str)
+            missing = {column: int(df[column].isna().sum()) for column in schema}
+            for column, dtype in schema.items():
+                df[column], invalid[column] = _coerce_column(df[column], dtype)
+
+        self._validation_report = {
+            'rows': len(df),
+            'engine': CSV_ENGINE,
+            'missing_columns': [column for column in self._columns if column not in header],
+            'unexpected_columns': [column for column in header if column not in self._columns],
+            'missing_values': {column: count for column, count in missing.items() if count},
+            'invalid_values': {column: count for column, count in invalid.items() if count},
+        }
+        report = self._validation_report
+        if report['missing_columns'] or report['unexpected_columns'] or report['missing_values'] or report['invalid_values']:
+            logging.warning(f"Validation issues in '{self._filename}': {report}")
+        return df
 
 ##########################################################################
             # Habit, HabitInstance, and HabitTable Classes
@@ -106,7 +328,7 @@ class Habit():
         return self._week_frequency
     
     @week_frequency.setter
-    def change_frequency(self, new_freq:int):
+    def week_frequency(self, new_freq:int):
         assert isinstance(new_freq, int), "New frequency must be an integer."
         assert new_freq > 0, "New frequency must be greater than zero."
         assert new_freq != self._week_frequency, "New frequency must be different from the current frequency."
@@ -119,7 +341,7 @@ class Habit():
         return self._instances
     
     @instances.setter
-    def change_instances(self, new_instances:int):
+    def instances(self, new_instances:int):
         assert isinstance(new_instances, int), "New instances must be an integer."
         assert new_instances >= 0, "New instances must be greater than or equal to zero."
         
@@ -132,39 +354,51 @@ class Habit():
     # Allows changing name, type, frequency, and instances
     def alter_habit(self, new_name:str = None, new_type:str = None, new_freq:int = None, new_instances:int = None):
         if new_name is not None:
-            self.name(new_name)
+            self.name = new_name
         if new_type is not None:
-            self.type(new_type)
+            self.type = new_type
         if new_freq is not None:
-            self.week_frequency(new_freq)
+            self.week_frequency = new_freq
         if new_instances is not None:
-            self.instances(new_instances)
+            self.instances = new_instances
 
 
 class HabitInstance():
     def __init__(self, habit:Habit, date:str, check:bool = False, out_of_control:bool = False):
         # Initializing the variables
         self._habit = habit
-        self._date = pd.to_datetime(date)
+        self._date = parse_date(date)
         self._check = check
         self._out_of_control = out_of_control
 
     # Setters and getters
     @property
     def date(self):
-        date_string = self._date.strftime("%d/%m/%Y")
+        date_string = self._date.strftime(DATE_FORMAT)
         return date_string
 
+    @date.setter
+    def date(self, new_date:str):
+        assert new_date is not None and (len(new_date) > 0), "New date must not be empty."
+        self._date = parse_date(new_date)
+
+    # Date of the instance as a pandas Timestamp, used to compare instances by date
+    @property
+    def timestamp(self):
+        return self._date
+
+    # Returns the habit name, which identifies the habit in the instance table
+    # Instances entered from the UI hold the habit name directly
     @property
     def habit(self):
-        return self._habit.__repr__()
+        return self._habit.name if isinstance(self._habit, Habit) else str(self._habit)
 
     @property
     def check(self):
         return self._check
     
     @check.setter
-    def change_check(self, new_check:bool):
+    def check(self, new_check:bool):
         assert isinstance(new_check, bool), "New check must be a boolean."        
         self._check = new_check
 
@@ -179,15 +413,24 @@ class HabitInstance():
 
     # String representation of the HabitInstance class
     def __repr__(self):
-        return f"Habit Instance Data:\n Habit: {self.habit}\n Date: {self.date_string}\n Done?: {'Yes' if self._check else 'No'}"
+        return f"Habit Instance Data:\n Habit: {self.habit}\n Date: {self.date}\n Done?: {'Yes' if self._check else 'No'}"
           
+# Habit attribute edited by each column of the HabitTable
+HABIT_ATTRIBUTES = {'Name': 'name', 'Type': 'type', 'Weekly Frequency': 'week_frequency', 'Instances': 'instances'}
+
 class HabitTable(QAbstractTableModel):
+    # Emitted with the previous name and the habit when its name or weekly frequency is edited
+    habit_edited = Signal(str, object)
+
     def __init__(self, habits:list=[], parent=None, csv_handler:CSVHandler = None):
         super().__init__(parent)
         if not all(isinstance(habit, Habit) for habit in habits):
             raise ValueError("All elements must be instances of the Habit class.")
         self._habits = habits
-        self._csv_handler = csv_handler if csv_handler else CSVHandler()
+        self._csv_handler = csv_handler if csv_handler else CSVHandler(schema=HABIT_SCHEMA)
+
+        # Rows edited in the table view that have not been saved yet
+        self._dirty_rows = set()
 
         self._habit_dataframe = pd.DataFrame({
             'Name': [habit.name for habit in habits],
@@ -205,6 +448,10 @@ class HabitTable(QAbstractTableModel):
     @property
     def habit_dataframe(self):
         return self._habit_dataframe
+
+    @property
+    def dirty_rows(self):
+        return sorted(self._dirty_rows)
     
     # Method to update the DataFrame based on the habits list
     # This method is called whenever a habit is added, removed, or modified
@@ -216,6 +463,7 @@ class HabitTable(QAbstractTableModel):
             'Instances': [habit.instances for habit in self._habits]
         })
         self.save_df_to_csv(self._csv_handler.filename)
+        self._dirty_rows.clear()
         #logging.info("Habit DataFrame updated and saved to CSV.")
         self.layoutChanged.emit()
 
@@ -231,11 +479,49 @@ class HabitTable(QAbstractTableModel):
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return None
-        if role == Qt.DisplayRole:
+        if role in (Qt.DisplayRole, Qt.EditRole):
             value = self._habit_dataframe.iloc[index.row(), index.column()]
-            return str(value)
+            return _format_value(value)
         return None
 
+    # Flags method to make the cells editable in the table view
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    # SetData method to edit a habit from the table view
+    # The habit and its DataFrame row are updated in place and the row is marked as dirty
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, column = index.row(), index.column()
+        habit = self._habits[row]
+        name = self._habit_dataframe.columns[column]
+        old_name = habit.name
+
+        try:
+            if name == 'Name':
+                habit.alter_habit(new_name=str(value).strip())
+            elif name == 'Type':
+                habit.alter_habit(new_type=str(value).strip())
+            elif name == 'Weekly Frequency':
+                habit.alter_habit(new_freq=int(value))
+            elif name == 'Instances':
+                habit.alter_habit(new_instances=int(value))
+            else:
+                return False
+        except (AssertionError, ValueError) as e:
+            logging.warning(f"Invalid value for '{name}': {e}")
+            return False
+
+        self._habit_dataframe.iat[row, column] = getattr(habit, HABIT_ATTRIBUTES[name])
+        self._dirty_rows.add(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        if name in ('Name', 'Weekly Frequency'):
+            self.habit_edited.emit(old_name, habit)
+        return True
+
     # Header data method to provide headers for the table view
     # This method is called to set the headers for the table view
     def headerData(self, section, orientation, role):
@@ -256,6 +542,16 @@ class HabitTable(QAbstractTableModel):
         else:
             raise ValueError("CSVHandler is not initialized.")
 
+    # Method to save only the edited rows to the CSV file
+    # This method uses the CSVHandler class to patch the modified records
+    def save_changes(self):
+        if self._csv_handler:
+            self._csv_handler.dataframe = self._habit_dataframe
+            self._csv_handler.save_rows(self._dirty_rows)
+            self._dirty_rows.clear()
+        else:
+            raise ValueError("CSVHandler is not initialized.")
+
     # Method to load the DataFrame from a CSV file
     # This method uses the CSVHandler class to load the DataFrame
     def load_df_from_csv(self, filename:str):
@@ -267,13 +563,159 @@ class HabitTable(QAbstractTableModel):
         else:
             raise ValueError("CSVHandler is not initialized.")
 
+##########################################################################
+                        # ReminderScheduler Class
+    # Emits a reminder when a habit is due, based on its weekly frequency
+##########################################################################
+
+class ReminderScheduler(QObject):
+    """
+    Keeps the next due time of every habit in a min-heap.
+
+    A single-shot QTimer is armed for the earliest deadline only, so no habit
+    is polled while idle. Logging an instance reschedules just that habit:
+    its old heap entry is marked as removed and a new one is pushed.
+    """
+    reminder_due = Signal(str)
+
+    # QTimer intervals are limited to a signed 32-bit number of milliseconds
+    MAX_TIMER_MS = 2**31 - 1
+
+    def __init__(self, habits:list=[], habit_instances:list=[], parent=None):
+        super().__init__(parent)
+
+        # Heap entries are [due, counter, name]; removed entries have name set to None
+        self._heap = []
+        self._entries = {}
+        self._removed = 0
+        self._counter = itertools.count()
+
+        # Interval between reminders and date of the last completed instance of each habit
+        self._intervals = {}
+        self._last_done = {}
+        for instance in habit_instances:
+            self._record_instance(instance)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+
+        for habit in habits:
+            self._schedule(habit.name, habit.week_frequency)
+        self._arm()
+
+    # Next due time of a habit, or None if the habit is not scheduled
+    def next_due(self, name:str):
+        entry = self._entries.get(name)
+        return entry[0] if entry else None
+
+    # Method to schedule a new habit or reschedule one whose frequency changed
+    def add_habit(self, habit:Habit):
+        self._schedule(habit.name, habit.week_frequency)
+        self._arm()
+
+    # Method to follow an edit of a habit
+    # A rename moves the habit's schedule to the new name and a frequency change reschedules it
+    def update_habit(self, old_name:str, habit:Habit):
+        if old_name != habit.name:
+            last_done = self._last_done.get(old_name)
+            self.remove_habit(old_name)
+            if last_done is not None:
+                self._last_done[habit.name] = last_done
+        self.add_habit(habit)
+
+    # Method to stop the reminders of a habit
+    def remove_habit(self, name:str):
+        self._intervals.pop(name, None)
+        self._last_done.pop(name, None)
+        self._invalidate(name)
+        self._arm()
+
+    # Method to reschedule the habit of a newly logged instance
+    # Only the heap entry of that habit is replaced
+    def instance_logged(self, instance:HabitInstance):
+        self.instances_logged([instance])
+
+    # Method to reschedule the habits of several logged instances
+    # Each affected habit is rescheduled once and the timer is armed once
+    def instances_logged(self, habit_instances:list):
+        changed = {instance.habit for instance in habit_instances if self._record_instance(instance)}
+        for name in changed & self._intervals.keys():
+            self._schedule(name, None)
+        if changed:
+            self._arm()
+
+    # Keeps the date of the last completed instance of a habit
+    # Returns True if the date changed
+    def _record_instance(self, instance:HabitInstance):
+        if not instance.check:
+            return False
+        last_done = self._last_done.get(instance.habit)
+        if last_done is not None and last_done >= instance.timestamp:
+            return False
+        self._last_done[instance.habit] = instance.timestamp
+        return True
+
+    # Pushes a new heap entry for a habit, replacing its previous one
+    # The habit is due one interval after its last completed instance, or now if it has none
+    def _schedule(self, name:str, week_frequency:int = None, due:pd.Timestamp = None):
+        if week_frequency is not None:
+            self._intervals[name] = pd.Timedelta(days=7) / max(int(week_frequency), 1)
+        if due is None:
+            last_done = self._last_done.get(name)
+            due = last_done + self._intervals[name] if last_done is not None else pd.Timestamp.now()
+
+        self._invalidate(name)
+        entry = [due, next(self._counter), name]
+        self._entries[name] = entry
+        heapq.heappush(self._heap, entry)
+
+    # Marks the heap entry of a habit as removed, rebuilding the heap when most entries are stale
+    def _invalidate(self, name:str):
+        entry = self._entries.pop(name, None)
+        if entry is None:
+            return
+        entry[2] = None
+        self._removed += 1
+        if self._removed > len(self._entries) and self._removed > 64:
+            self._heap = [entry for entry in self._heap if entry[2] is not None]
+            heapq.heapify(self._heap)
+            self._removed = 0
+
+    # Arms the timer for the earliest deadline, discarding removed entries on top of the heap
+    def _arm(self):
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+            self._removed -= 1
+        if not self._heap:
+            self._timer.stop()
+            return
+        delay = (self._heap[0][0] - pd.Timestamp.now()).total_seconds() * 1000
+        self._timer.start(int(min(max(delay, 0), self.MAX_TIMER_MS)))
+
+    # Timer handler: emits the reminders that are due and schedules their next reminder
+    def _fire(self):
+        now = pd.Timestamp.now()
+        while self._heap and self._heap[0][0] <= now:
+            due, _, name = heapq.heappop(self._heap)
+            if name is None:
+                self._removed -= 1
+                continue
+            del self._entries[name]
+            self.reminder_due.emit(name)
+            self._schedule(name, due=now + self._intervals[name])
+        self._arm()
+
 ##########################################################################
                         # MainWindow Class
 ##########################################################################
 
 class MainWindow(QMainWindow):
-    def __init__(self, habit_list:list=[], habit_instance_list:list=[]): #, parent=None):
+    def __init__(self, habit_list:list=[], habit_instance_list:list=[], sync_store=None): #, parent=None):
         super().__init__()
+
+        # Optional habit_sync.SyncStore used to sync the habit instances between devices
+        self._sync_store = sync_store
         
         # Setting up the main window name and dimensions
         self.setWindowTitle("Habit Tracker by Leonardo Scarton")
@@ -285,10 +727,24 @@ class MainWindow(QMainWindow):
         # Initializing the HabitTable and HabitInstanceTable with provided lists
         self._habit_table = HabitTable(habit_list)
         self._habit_window = HabitWindow(parent=self, habit_table=self._habit_table)
-        self._habit_instance_table = HabitInstanceTable(habit_instance_list)
+        self._habit_instance_table = HabitInstanceTable(habit_instance_list, sync_store=sync_store)
+        # Without instances given, the saved instances are loaded, so new ones are added to them
+        if not habit_instance_list:
+            self._habit_instance_table.load_df_from_csv(self._habit_instance_table._csv_handler.filename)
+        # Instances logged before syncing was enabled are added to the sync store once
+        if sync_store is not None:
+            sync_store.seed([(instance.habit, instance.date, instance.check, instance.out_of_control)
+                             for instance in self._habit_instance_table._habit_instances])
         self._habit_instance_window = HabitInstanceWindow(parent=self, habit_instance_table=self._habit_instance_table)
         self._data_window = DataWindow(habit_table=self._habit_table, parent=self)
 
+        # Initializing the reminders for the habits
+        # Reminders are shown in the status bar
+        self._reminder_scheduler = ReminderScheduler(habit_list, self._habit_instance_table._habit_instances, parent=self)
+        self._reminder_scheduler.reminder_due.connect(self.show_reminder)
+        self._habit_table.habit_edited.connect(self._reminder_scheduler.update_habit)
+        self._habit_instance_table.instance_edited.connect(self._reminder_scheduler.instance_logged)
+
         # Setting up the main layout
         self.container_start = QWidget()
         self.container_start.setLayout(self._layout)
@@ -322,6 +778,10 @@ class MainWindow(QMainWindow):
         self._start_button.hide()
         self.container_habit_table.show()
 
+    # Reminder Handler
+    def show_reminder(self, habit_name:str):
+        self.statusBar().showMessage(f"Reminder: '{habit_name}' is due.", 10000)
+
 
 ##########################################################################
             # HabitWindow and AddHabitWindow Classes
@@ -360,7 +820,11 @@ class HabitWindow(QWidget):
         button_change_data_window = QPushButton("Habit Data")
         button_change_data_window.clicked.connect(self.change_window_to_data_window)
 
+        button_save = QPushButton("Save Changes")
+        button_save.clicked.connect(self._habit_table.save_changes)
+
         button_layout.addWidget(button_add)
+        button_layout.addWidget(button_save)
         button_layout.addWidget(button_change_habit_instance_window)
         button_layout.addWidget(button_change_data_window)
         layout.addLayout(button_layout)
@@ -385,6 +849,7 @@ class AddHabitWindow(QMainWindow):
         super().__init__(parent)
 
         # Setting up the AddHabitWindow dimensions and title
+        self.parent = parent
         self.setGeometry(0, 0, 400, 200)
         self.setWindowTitle("Add New Habit")
 
@@ -434,29 +899,42 @@ class AddHabitWindow(QMainWindow):
         new_habit = Habit(name, type_, freq)
         self.parent._habit_table._habits.append(new_habit)
         self.parent._habit_table.update_dataframe()
+        self.parent.parent._reminder_scheduler.add_habit(new_habit)
 
         self.close()
 
 class HabitInstanceTable(QAbstractTableModel):
-    def __init__(self, habit_instances:list=[], parent=None, csv_handler:CSVHandler = None):
+    # Emitted with the instance when its date or its Done? value is edited
+    instance_edited = Signal(object)
+
+    def __init__(self, habit_instances:list=[], parent=None, csv_handler:CSVHandler = None, sync_store=None):
         super().__init__(parent)
 
         # Initializing the variables
         if not all(isinstance(instance, HabitInstance) for instance in habit_instances):
             raise ValueError("All elements must be instances of the HabitInstance class.")
-        self._habit_instances = habit_instances
+        self._habit_instances = list(habit_instances)
+
+        self._csv_handler = csv_handler if csv_handler else CSVHandler("habit_instances.csv", columns=list(HABIT_INSTANCE_SCHEMA), schema=HABIT_INSTANCE_SCHEMA)
 
-        self._csv_handler = csv_handler if csv_handler else CSVHandler()
+        # Optional habit_sync.SyncStore that receives every added or edited instance
+        self._sync_store = sync_store
+
+        # Rows edited in the table view that have not been saved yet
+        self._dirty_rows = set()
 
         # Creating a DataFrame to hold the habit instances
         # The DataFrame will have columns for Habit, Date, Done and Conditions Out of Control
         self._habit_instance_dataframe = pd.DataFrame({
             'Habit': [instance.habit for instance in habit_instances],
-            'Date': [instance.date_string for instance in habit_instances],
+            'Date': [instance.date for instance in habit_instances],
             'Done?': [instance._check for instance in habit_instances],
             'Conditions Out of Control?': [instance._out_of_control for instance in habit_instances]
         })
 
+        # (habit, date) pairs that already have an instance, used to reject duplicates
+        self._instance_keys = set(zip(self._habit_instance_dataframe['Habit'], self._habit_instance_dataframe['Date']))
+
     # Row and Column Count methods
     # These methods are required by the QAbstractTableModel interface
     def rowCount(self, parent=None):
@@ -470,6 +948,10 @@ class HabitInstanceTable(QAbstractTableModel):
     def dataframe(self):
         return self._habit_instance_dataframe
 
+    @property
+    def dirty_rows(self):
+        return sorted(self._dirty_rows)
+
     # Method to update the DataFrame based on the habit instances list
     # This method is called whenever a habit instance is added, removed, or modified
     def update_dataframe(self):
@@ -479,18 +961,155 @@ class HabitInstanceTable(QAbstractTableModel):
             'Done?': [instance.check for instance in self._habit_instances],
             'Conditions Out of Control?': [instance.out_of_control for instance in self._habit_instances]
         })
+        self._instance_keys = set(zip(self._habit_instance_dataframe['Habit'], self._habit_instance_dataframe['Date']))
         self.layoutChanged.emit()
 
+    # Method to add several habit instances at once
+    # Only the new rows are built, the view is notified once and the rows are saved with one write
+    # The new instances are also recorded in the sync store, unless they came from it
+    def add_instances(self, habit_instances:list, record:bool = True):
+        if not all(isinstance(instance, HabitInstance) for instance in habit_instances):
+            raise ValueError("All elements must be instances of the HabitInstance class.")
+        if not habit_instances:
+            return
+        new_keys = [(instance.habit, instance.date) for instance in habit_instances]
+        if len(set(new_keys)) != len(new_keys) or not self._instance_keys.isdisjoint(new_keys):
+            raise ValueError("An instance already exists for one of the habits and dates.")
+
+        new_rows = pd.DataFrame({
+            'Habit': [instance.habit for instance in habit_instances],
+            'Date': [instance.date for instance in habit_instances],
+            'Done?': [instance.check for instance in habit_instances],
+            'Conditions Out of Control?': [instance.out_of_control for instance in habit_instances]
+        })
+        first = len(self._habit_instances)
+        self.beginInsertRows(QModelIndex(), first, first + len(habit_instances) - 1)
+        self._habit_instances.extend(habit_instances)
+        if self._habit_instance_dataframe.empty:
+            self._habit_instance_dataframe = new_rows
+        else:
+            self._habit_instance_dataframe = pd.concat([self._habit_instance_dataframe, new_rows], ignore_index=True)
+        self._instance_keys.update(new_keys)
+        self.endInsertRows()
+        self.save_changes()
+        if self._sync_store is not None and record:
+            self._sync_store.record_many([(instance.habit, instance.date, instance.check, instance.out_of_control) for instance in habit_instances])
+
+    # Method to apply the records accepted from a sync
+    # Existing rows are updated in place, new ones are added in bulk and deleted ones are removed
+    # Returns the instances that were added or updated
+    def apply_synced(self, changes:pd.DataFrame):
+        if changes.empty:
+            return []
+        changes = changes.drop_duplicates(['Habit', 'Date'], keep='last')
+        df = self._habit_instance_dataframe
+        rows = {key: row for row, key in enumerate(zip(df['Habit'], df['Date']))}
+        check_column = df.columns.get_loc('Done?')
+        out_of_control_column = df.columns.get_loc('Conditions Out of Control?')
+
+        changed, new_instances, deleted_rows = [], [], set()
+        for habit, date, check, out_of_control, deleted in changes[list(HABIT_INSTANCE_SCHEMA) + ['Deleted']].itertuples(index=False):
+            row = rows.get((habit, date))
+            if deleted:
+                if row is not None:
+                    deleted_rows.add(row)
+            elif row is None:
+                new_instances.append(HabitInstance(habit, date, bool(check), bool(out_of_control)))
+            else:
+                instance = self._habit_instances[row]
+                instance.check = bool(check)
+                instance.out_of_control = bool(out_of_control)
+                df.iat[row, check_column] = instance.check
+                df.iat[row, out_of_control_column] = instance.out_of_control
+                self._dirty_rows.add(row)
+                self.dataChanged.emit(self.index(row, check_column), self.index(row, out_of_control_column))
+                changed.append(instance)
+
+        if deleted_rows:
+            # Removing rows shifts the file lines, so the next save rewrites the file
+            self.beginResetModel()
+            self._habit_instances = [instance for row, instance in enumerate(self._habit_instances) if row not in deleted_rows]
+            self._dirty_rows.clear()
+            self.update_dataframe()
+            self.endResetModel()
+            self._csv_handler.mark_unsaved()
+
+        if new_instances:
+            self.add_instances(new_instances, record=False)
+        else:
+            self.save_changes()
+        return changed + new_instances
+
+    # Returns the (habit, date) pairs that already have an instance
+    # Dates are formatted with DATE_FORMAT
+    def instance_keys(self):
+        return self._instance_keys
+
+    # Returns True if the habit already has an instance on the date
+    def has_instance(self, habit_name:str, date:str):
+        return (habit_name, date) in self._instance_keys
+
     # Data method to retrieve data for the table view
     # This method is called to get the data for each cell in the table view
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return None
-        if role == Qt.DisplayRole:
+        if role in (Qt.DisplayRole, Qt.EditRole):
             value = self._habit_instance_dataframe.iloc[index.row(), index.column()]
-            return str(value)
+            return _format_value(value)
         return None
 
+    # Flags method to make the cells editable in the table view
+    # The Habit column is read-only, since instances are tied to their habit
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if self._habit_instance_dataframe.columns[index.column()] != 'Habit':
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    # SetData method to edit a habit instance from the table view
+    # The instance and its DataFrame row are updated in place and the row is marked as dirty
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, column = index.row(), index.column()
+        instance = self._habit_instances[row]
+        name = self._habit_instance_dataframe.columns[column]
+
+        try:
+            if name == 'Date':
+                old_key = (instance.habit, instance.date)
+                new_key = (instance.habit, parse_date(str(value)).strftime(DATE_FORMAT))
+                assert new_key == old_key or new_key not in self._instance_keys, "An instance already exists for this habit and date."
+                instance.date = str(value).strip()
+                new_value = instance.date
+                self._instance_keys.discard(old_key)
+                self._instance_keys.add(new_key)
+                if self._sync_store is not None and new_key != old_key:
+                    self._sync_store.delete(*old_key)
+            elif name == 'Done?':
+                instance.check = parse_bool(value)
+                new_value = instance.check
+            elif name == 'Conditions Out of Control?':
+                instance.out_of_control = parse_bool(value)
+                new_value = instance.out_of_control
+            else:
+                return False
+        except (AssertionError, ValueError) as e:
+            logging.warning(f"Invalid value for '{name}': {e}")
+            return False
+
+        self._habit_instance_dataframe.iat[row, column] = new_value
+        self._dirty_rows.add(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        if self._sync_store is not None:
+            self._sync_store.record(instance.habit, instance.date, instance.check, instance.out_of_control)
+        if name in ('Date', 'Done?'):
+            self.instance_edited.emit(instance)
+        return True
+
     # Header data method to provide headers for the table view
     # This method is called to set the headers for the table view
     def headerData(self, section, orientation, role):
@@ -510,15 +1129,40 @@ class HabitInstanceTable(QAbstractTableModel):
             self._csv_handler.save_to_csv()
         else:
             raise ValueError("CSVHandler is not initialized.")
+
+    # Method to save only the edited and newly added rows to the CSV file
+    # This method uses the CSVHandler class to patch the modified records
+    def save_changes(self):
+        if self._csv_handler:
+            self._csv_handler.dataframe = self._habit_instance_dataframe
+            self._csv_handler.save_rows(self._dirty_rows)
+            self._dirty_rows.clear()
+        else:
+            raise ValueError("CSVHandler is not initialized.")
         
     # Method to load the DataFrame from a CSV file
     # This method uses the CSVHandler class to load the DataFrame
+    # The loaded rows become HabitInstance objects, so they can be edited and saved like new ones
     def load_df_from_csv(self, filename:str):
         if self._csv_handler:
             self._csv_handler.filename = filename
             self._csv_handler.load_from_csv()
-            self._habit_instance_dataframe = self._csv_handler.dataframe
+            df = self._csv_handler.dataframe
+            habit_instances = [
+                HabitInstance(habit, date, bool(check) if pd.notna(check) else False, bool(out_of_control) if pd.notna(out_of_control) else False)
+                for habit, date, check, out_of_control in zip(df['Habit'], df['Date'], df['Done?'], df['Conditions Out of Control?'])
+                if pd.notna(habit) and pd.notna(date)
+            ] if not df.empty else []
+            if len(habit_instances) != len(df):
+                # Rows without a habit or a valid date are dropped, so the file no longer matches the model
+                logging.warning(f"Skipped {len(df) - len(habit_instances)} invalid rows in '{filename}'.")
+                self._csv_handler.mark_unsaved()
+
+            self.beginResetModel()
+            self._habit_instances = habit_instances
+            self._dirty_rows.clear()
             self.update_dataframe()
+            self.endResetModel()
         else:
             raise ValueError("CSVHandler is not initialized.")
 
@@ -561,6 +1205,11 @@ class HabitInstanceWindow(QWidget):
         button_add = QPushButton("Add New Habit Instance")
         button_add.clicked.connect(self.add_click)
 
+        # Batch Entry Button
+        # This button will open the BatchHabitInstanceWindow when clicked
+        button_batch = QPushButton("Batch Entry")
+        button_batch.clicked.connect(self.batch_click)
+
         # Change Window to Habit Window Button
         button_change_habit_window = QPushButton("Habit List")
         button_change_habit_window.clicked.connect(self.change_window_to_habit_window)
@@ -569,8 +1218,22 @@ class HabitInstanceWindow(QWidget):
         button_change_data_window = QPushButton("Habit Data")
         button_change_data_window.clicked.connect(self.change_window_to_data_window)
 
+        # Save Changes Button
+        # This button will save only the edited and new habit instances
+        button_save = QPushButton("Save Changes")
+        button_save.clicked.connect(self._habit_instance_table.save_changes)
+
         # Adding buttons to the button layout
         button_layout.addWidget(button_add)
+        button_layout.addWidget(button_batch)
+        button_layout.addWidget(button_save)
+
+        # Sync Button, only shown when a sync store is available
+        # This button will exchange the changed instances through a shared folder
+        if self.parent._sync_store is not None:
+            button_sync = QPushButton("Sync")
+            button_sync.clicked.connect(self.sync_click)
+            button_layout.addWidget(button_sync)
         button_layout.addWidget(button_change_habit_window)
         button_layout.addWidget(button_change_data_window)
         layout.addLayout(button_layout)
@@ -581,6 +1244,23 @@ class HabitInstanceWindow(QWidget):
         add_habit_instance_window = AddHabitInstanceWindow(parent=self)
         add_habit_instance_window.show()
 
+    # Sync Button Click Handler
+    # Sends the local changes to the chosen folder and applies the changes of the other devices
+    def sync_click(self):
+        directory = QFileDialog.getExistingDirectory(self, "Sync Folder")
+        if not directory:
+            return
+        sent, accepted = self.parent._sync_store.sync_with_folder(directory)
+        changed = self._habit_instance_table.apply_synced(accepted)
+        self.parent._reminder_scheduler.instances_logged(changed)
+        self.parent.statusBar().showMessage(f"Synced: sent {sent}, received {len(accepted)} changes.", 10000)
+
+    # Batch Entry Button Click Handler
+    # This method will open the BatchHabitInstanceWindow when the button is clicked
+    def batch_click(self):
+        batch_habit_instance_window = BatchHabitInstanceWindow(parent=self)
+        batch_habit_instance_window.show()
+
     # Change Window to Habit Window Handler
     def change_window_to_habit_window(self):
         self.parent.container_habit_instance_table.hide()
@@ -597,6 +1277,7 @@ class AddHabitInstanceWindow(QMainWindow):
         super().__init__(parent)
 
         # Setting up the AddHabitInstanceWindow dimensions and title
+        self.parent = parent
         self.setGeometry(0, 0, 400, 200)
         self.setWindowTitle("Habit Instances")
 
@@ -648,15 +1329,121 @@ class AddHabitInstanceWindow(QMainWindow):
             QMessageBox.warning(self, "Input Error", "Please fill in all fields.")
             return
 
-        new_habit_instance = HabitInstance(habit_name, date, check, out_of_control)
-        self.parent._habit_instance_table._habit_instances.append(new_habit_instance)
-        self.parent._habit_instance_table.update_dataframe()
+        try:
+            new_habit_instance = HabitInstance(habit_name, date, check, out_of_control)
+        except ValueError:
+            QMessageBox.warning(self, "Input Error", f"Invalid date: {date}")
+            return
+        if self.parent._habit_instance_table.has_instance(new_habit_instance.habit, new_habit_instance.date):
+            QMessageBox.warning(self, "Input Error", f"This instance already exists:\n{new_habit_instance.habit} ({new_habit_instance.date})")
+            return
+        self.parent._habit_instance_table.add_instances([new_habit_instance])
+        self.parent.parent._reminder_scheduler.instance_logged(new_habit_instance)
 
         self.close()
 
     def close(self):
         super().close()
 
+class BatchHabitInstanceWindow(QMainWindow):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Setting up the BatchHabitInstanceWindow dimensions and title
+        self.parent = parent
+        self.setGeometry(0, 0, 400, 400)
+        self.setWindowTitle("Batch Entry")
+
+        # Initializing the layout for the BatchHabitInstanceWindow
+        layout = QFormLayout()
+
+        # Creating a checklist with every habit
+        self._habit_list = QListWidget()
+        for habit in self.parent.parent._habit_table._habits:
+            item = QListWidgetItem(habit.name)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Unchecked)
+            self._habit_list.addItem(item)
+
+        # Creating input fields for the date range and the status of every instance
+        self._start_date = QDateEdit(QDate.currentDate())
+        self._start_date.setCalendarPopup(True)
+        self._start_date.setDisplayFormat("dd/MM/yyyy")
+        self._end_date = QDateEdit(QDate.currentDate())
+        self._end_date.setCalendarPopup(True)
+        self._end_date.setDisplayFormat("dd/MM/yyyy")
+        self._check_box = QComboBox()
+        self._check_box.addItems(["Yes", "No"])
+        self._out_of_control_box = QComboBox()
+        self._out_of_control_box.addItems(["No", "Yes"])
+
+        # Adding input fields to the layout
+        layout.addRow(QLabel("Habits:"), self._habit_list)
+        layout.addRow(QLabel("From:"), self._start_date)
+        layout.addRow(QLabel("To:"), self._end_date)
+        layout.addRow(QLabel("Done?"), self._check_box)
+        layout.addRow(QLabel("Conditions Out of Control?"), self._out_of_control_box)
+
+        # Today button will check every habit for the current date
+        today_button = QPushButton("Today: All Habits")
+        today_button.clicked.connect(self.select_today)
+        layout.addRow(today_button)
+
+        # Enter button will call the enter_habit_instances method
+        enter_button = QPushButton("Enter")
+        enter_button.clicked.connect(self.enter_habit_instances)
+        layout.addRow(enter_button)
+
+        # Cancel button will close the BatchHabitInstanceWindow
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.close)
+        layout.addRow(cancel_button)
+
+        # Setting the layout to a central widget
+        container_start = QWidget()
+        container_start.setLayout(layout)
+        self.setCentralWidget(container_start)
+
+    # Today Button Click Handler
+    # Checks every habit and sets the date range to the current date
+    def select_today(self):
+        for row in range(self._habit_list.count()):
+            self._habit_list.item(row).setCheckState(Qt.Checked)
+        self._start_date.setDate(QDate.currentDate())
+        self._end_date.setDate(QDate.currentDate())
+
+    # Function to handle the Enter button click and enter every habit x date instance
+    # All rows are validated before any of them is added to the habit instance table
+    def enter_habit_instances(self):
+        names = [self._habit_list.item(row).text() for row in range(self._habit_list.count())
+                 if self._habit_list.item(row).checkState() == Qt.Checked]
+        start = self._start_date.date().toPython()
+        end = self._end_date.date().toPython()
+        check = self._check_box.currentText() == "Yes"
+        out_of_control = self._out_of_control_box.currentText() == "Yes"
+
+        if not names:
+            QMessageBox.warning(self, "Input Error", "Please select at least one habit.")
+            return
+        if start > end:
+            QMessageBox.warning(self, "Input Error", "The start date must not be after the end date.")
+            return
+
+        dates = pd.date_range(start, end, freq='D')
+        existing = self.parent._habit_instance_table.instance_keys()
+        duplicates = [f"{name} ({date.strftime(DATE_FORMAT)})" for name in names for date in dates
+                      if (name, date.strftime(DATE_FORMAT)) in existing]
+        if duplicates:
+            QMessageBox.warning(self, "Input Error", "These instances already exist:\n" + "\n".join(duplicates))
+            return
+
+        # Instances hold the habit name, like the ones entered one by one or loaded from the file
+        new_habit_instances = [HabitInstance(name, date, check, out_of_control) for name in names for date in dates]
+        self.parent._habit_instance_table.add_instances(new_habit_instances)
+        self.parent.parent._reminder_scheduler.instances_logged(new_habit_instances)
+
+        self.close()
+
 ##########################################################################
                         # DataWindow Classes
 ##########################################################################
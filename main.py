@@ -2,11 +2,12 @@
 #import numpy as np
 import sys
 from habits_gui import MainWindow
+from habit_sync import SyncStore
 from PySide6.QtWidgets import QApplication
     
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = MainWindow()
+    window = MainWindow(sync_store=SyncStore())
     window.show()
 
     app.exec()
\ No newline at end of file